@@ -7,85 +7,270 @@ Streamlit Dashboard for GitHub Trends Analysis
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from collections import namedtuple
 from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 import os
+import functools
+import hmac
 
+# Per-repository fields read by the dashboard; everything else stays on the server.
+# The analysis metadata is identical for all rows and is read once from the latest document.
+ANALYSIS_PROJECTION = {
+    '_id': 0,
+    'full_name': 1,
+    'author': 1,
+    'description': 1,
+    'start_stars': 1,
+    'end_stars': 1,
+    'star_growth': 1,
+    'growth_per_day': 1,
+    'growth_percent': 1,
+    'url': 1,
+}
+
+# Column buffers filled by `convert_analysis_to_dataframe`. Numeric fields are read
+# as floats (missing values become NaN) and narrowed by `format_metrics`; missing
+# strings stay None.
+COLUMN_DTYPES = {
+    'start_stars': np.float64,
+    'end_stars': np.float64,
+    'star_growth': np.float64,
+    'growth_per_day': np.float64,
+    'growth_percent': np.float64,
+    'full_name': object,
+    'author': object,
+    'description': object,
+    'url': object,
+    'category': object,
+}
+
+# Analysis metadata with the dates already parsed, see `parse_meta`
+Meta = namedtuple('Meta', ['analysis_date', 'start_date', 'end_date', 'period_days'])
+
+ANALYSIS_METADATA_PROJECTION = {
+    '_id': 0,
+    'analysis_date': 1,
+    'analysis_period_days': 1,
+    'analysis_start_date': 1,
+    'analysis_end_date': 1,
+}
+
+
+@st.cache_resource
+def _get_db(mongo_uri):
+    """Create the MongoDB client once per server process and return the database."""
+    # Compress the wire protocol (zstd, falling back to zlib on older servers)
+    # and let replica set secondaries serve the read-only dashboard queries.
+    # The pool is shared by all sessions; fail fast if no server is reachable.
+    client = MongoClient(
+        mongo_uri,
+        compressors='zstd,zlib',
+        zlibCompressionLevel=6,
+        readPreference='secondaryPreferred',
+        maxPoolSize=20,
+        serverSelectionTimeoutMS=3000
+    )
+    db = client["github_trends"]
+    
+    # Indexes for the latest-date lookup and per-date queries (all of them
+    # match or sort on analysis_date only) and for the category $lookup;
+    # creating an existing index is a no-op. Read-only users, or a replica set
+    # without a primary, simply skip this step; the reads still work.
+    try:
+        db['analysis'].create_index('analysis_date')
+        db['repositories'].create_index('full_name')
+    except PyMongoError:
+        pass
+    
+    return db
 
 def get_mongodb_connection():
     """Establish MongoDB connection using environment variables."""
     mongo_uri = st.secrets.get("MONGODB_URI")
-    mongo_db = "github_trends"
     
     if not mongo_uri:
         st.error("MONGODB_URI is not set. Please add it to your .env file.")
         return None
     
-    client = MongoClient(mongo_uri)
-    db = client[mongo_db]
-    return db
+    return _get_db(mongo_uri)
 
-def get_latest_analysis():
-    """Retrieve the latest analysis from MongoDB and merge with repository categories."""
-    db = get_mongodb_connection()
-    if db is None:
-        return None
+def _build_analysis_query(latest_date):
+    """Build the MongoDB query for the repositories of one analysis date."""
+    return {'analysis_date': latest_date}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_latest_doc(_db):
+    """Fetch the latest analysis metadata and its repository count (cached between reruns).
     
-    analysis_collection = db['analysis']
-    repositories_collection = db['repositories']
+    Returns a `(latest_doc, total_count)` tuple; `latest_doc` is None when the
+    analysis collection is empty.
+    """
+    analysis_collection = _db['analysis']
     
     # Find the most recent analysis date
     latest_analysis_date = analysis_collection.find_one(
-        sort=[('analysis_date', -1)]
+        sort=[('analysis_date', -1)],
+        projection=ANALYSIS_METADATA_PROJECTION
     )
     
     if latest_analysis_date is None:
-        st.error("No analysis data found in MongoDB.")
+        return None, 0
+    
+    total_count = analysis_collection.count_documents(
+        _build_analysis_query(latest_analysis_date.get('analysis_date'))
+    )
+    
+    return latest_analysis_date, total_count
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_formatted_df(_db, latest_date, expected_count):
+    """Load all repositories of one analysis as a formatted DataFrame (cached between reruns).
+    
+    Runs the whole fetch -> convert -> format pipeline once per analysis date;
+    the dashboard filters only index the returned frame. `expected_count` is
+    the repository count from `_fetch_latest_doc`, used to size the column
+    buffers. Returns None if the analysis has no repositories.
+    """
+    analysis_collection = _db['analysis']
+    
+    # Join the category from the repositories collection on the server and
+    # stream only the projected fields
+    pipeline = [
+        {'$match': _build_analysis_query(latest_date)},
+        {'$lookup': {
+            'from': 'repositories',
+            'localField': 'full_name',
+            'foreignField': 'full_name',
+            'as': 'repository'
+        }},
+        {'$project': {
+            **ANALYSIS_PROJECTION,
+            'category': {'$arrayElemAt': ['$repository.category', 0]}
+        }},
+    ]
+    cursor = analysis_collection.aggregate(pipeline, batchSize=500)
+    df = convert_analysis_to_dataframe(cursor, expected_count)
+    if df is None:
         return None
     
-    latest_date = latest_analysis_date.get('analysis_date')
+    df = format_metrics(df)
     
-    # Get all repositories from the latest analysis
-    latest_analysis = list(analysis_collection.find(
-        {'analysis_date': latest_date}
-    ))
+    # The filter results cached below derive from this frame, drop them with it
+    get_category_breakdown.clear()
+    get_top_performers.clear()
+    
+    # Low-cardinality category column, filtered and grouped on integer codes
+    df['category'] = df['category'].astype('category')
+    
+    # Highest growth first; main() relies on this order to filter on the
+    # minimum growth with a binary search
+    df = df.sort_values('growth_percent', ascending=False, kind='stable', ignore_index=True)
+    
+    # Arrow-backed strings are handed to Streamlit's Arrow serialization
+    # without per-row conversion; authors repeat across repositories and are
+    # dictionary-encoded
+    return df.astype({
+        'full_name': 'string[pyarrow]',
+        'author': 'category',
+        'description': 'string[pyarrow]',
+        'url': 'string[pyarrow]'
+    })
+
+def get_latest_analysis():
+    """Retrieve the latest analysis from MongoDB and merge with repository categories.
     
-    if not latest_analysis:
-        st.error("No analysis data found for the latest analysis date.")
+    Returns a `(latest_doc, total_count, df)` tuple, or None if nothing could be loaded.
+    """
+    db = get_mongodb_connection()
+    if db is None:
         return None
     
-    # Get category information from repositories collection
-    repo_categories = {}
-    for repo in repositories_collection.find({}, {'full_name': 1, 'category': 1}):
-        repo_categories[repo['full_name']] = repo.get('category')
+    latest_doc, total_count = _fetch_latest_doc(db)
     
-    # Merge category information into analysis data
-    for repo_analysis in latest_analysis:
-        full_name = repo_analysis.get('full_name')
-        if full_name in repo_categories:
-            repo_analysis['category'] = repo_categories[full_name]
-        else:
-            repo_analysis['category'] = None
+    if latest_doc is None:
+        st.error("No analysis data found in MongoDB.")
+        return None
+    
+    if total_count == 0:
+        st.error("No analysis data found for the latest analysis date.")
+        return None
     
-    return latest_analysis
+    return latest_doc, total_count, load_formatted_df(db, latest_doc.get('analysis_date'), total_count)
 
-def convert_analysis_to_dataframe(analysis_data):
-    """Convert MongoDB analysis documents to pandas DataFrame."""
-    if not analysis_data:
+def get_summary_stats(filtered_df):
+    """Compute the summary statistics of the filtered repositories.
+    
+    Uses the same formatted values as the table, so both describe the same rows.
+    Returns a dict with `avg_growth`, `max_growth`, `total_star_growth` and
+    `avg_stars`, or None if no repository matches.
+    """
+    if filtered_df.empty:
         return None
     
-    # Convert list of repository documents to DataFrame
-    df = pd.DataFrame(analysis_data)
+    # Accumulate in 64 bits, the columns are downcast by format_metrics
+    growth = filtered_df['growth_percent'].to_numpy()
+    return {
+        'avg_growth': growth.mean(dtype=np.float64),
+        'max_growth': growth.max(),
+        'total_star_growth': filtered_df['star_growth'].to_numpy().sum(dtype=np.int64),
+        'avg_stars': filtered_df['end_stars'].to_numpy().mean(dtype=np.float64),
+    }
+
+def convert_analysis_to_dataframe(cursor, expected_count):
+    """Convert MongoDB analysis documents to pandas DataFrame.
+    
+    The cursor is consumed document by document and the DataFrame is built
+    column-wise: every field goes into a NumPy array of its `COLUMN_DTYPES`
+    dtype, preallocated for `expected_count` rows, so no intermediate list of
+    documents is kept and pandas has no per-value type inference to do.
+    """
+    def empty_column(dtype, size):
+        return np.full(size, np.nan if dtype is np.float64 else None, dtype=dtype)
+    
+    columns = {col: empty_column(dtype, expected_count) for col, dtype in COLUMN_DTYPES.items()}
+    count = 0
+    for doc in cursor:
+        if count == len(columns['end_stars']):
+            # More documents than counted (e.g. inserted meanwhile), grow the buffers
+            for col, values in columns.items():
+                grown = empty_column(COLUMN_DTYPES[col], max(2 * count, 1))
+                grown[:count] = values
+                columns[col] = grown
+        
+        for col, values in columns.items():
+            value = doc.get(col)
+            if value is not None:
+                values[count] = value
+        count += 1
     
-    # Extract analysis metadata from the first document
-    if not df.empty:
-        first_doc = analysis_data[0]
-        df['analysis_date'] = first_doc.get('analysis_date')
-        df['analysis_period_days'] = first_doc.get('analysis_period_days')
-        df['analysis_start_date'] = first_doc.get('analysis_start_date')
-        df['analysis_end_date'] = first_doc.get('analysis_end_date')
+    if count == 0:
+        return None
     
-    return df
+    return pd.DataFrame({col: values[:count] for col, values in columns.items()})
+
+@functools.lru_cache(maxsize=64)
+def _parse_iso(s):
+    """Parse an ISO date string, a trailing `Z` means UTC."""
+    return datetime.fromisoformat(s[:-1] + '+00:00' if s.endswith('Z') else s)
+
+def _parse_date(value):
+    """Parse ISO date strings with `_parse_iso`; other values are returned unchanged."""
+    if value and isinstance(value, str):
+        return _parse_iso(value)
+    return value
+
+@st.cache_data(ttl=300, show_spinner=False)
+def parse_meta(meta_dict):
+    """Convert the latest analysis metadata document into a `Meta` tuple."""
+    return Meta(
+        analysis_date=_parse_date(meta_dict.get('analysis_date')),
+        start_date=_parse_date(meta_dict.get('analysis_start_date')),
+        end_date=_parse_date(meta_dict.get('analysis_end_date')),
+        period_days=meta_dict.get('analysis_period_days', 0)
+    )
 
 def format_metrics(df):
     """Format numeric columns for better display."""
@@ -95,40 +280,107 @@ def format_metrics(df):
     if df.empty:
         return df
     
-    # Format percentage columns
-    if 'growth_percent' in df.columns:
-        df['growth_percent'] = df['growth_percent'].fillna(0)
-        df['growth_percent'] = df['growth_percent'].replace([float('inf'), float('-inf')], 0)
-        df['growth_percent'] = df['growth_percent'].round(2)
-    
-    # Format growth per day
-    if 'growth_per_day' in df.columns:
-        df['growth_per_day'] = df['growth_per_day'].fillna(0)
-        df['growth_per_day'] = df['growth_per_day'].replace([float('inf'), float('-inf')], 0)
-        df['growth_per_day'] = df['growth_per_day'].round(2)
-    
-    # Format star counts - handle NaN and infinite values
-    star_columns = ['start_stars', 'end_stars', 'star_growth']
-    for col in star_columns:
+    # Format growth columns - NaN and infinite values become 0, rounded in the same pass,
+    # then stored as float32
+    for col in ['growth_percent', 'growth_per_day']:
+        if col in df.columns:
+            values = np.nan_to_num(df[col].to_numpy(dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+            df[col] = pd.to_numeric(np.round(values, 2, out=values), downcast='float')
+    
+    # Format star counts - handle NaN and infinite values, then store them in the
+    # smallest integer type that fits (star growth can be negative)
+    star_columns = {'start_stars': 'unsigned', 'end_stars': 'unsigned', 'star_growth': 'integer'}
+    for col, downcast in star_columns.items():
         if col in df.columns:
-            # Fill NaN values with 0 and convert infinite values to 0
-            df[col] = df[col].fillna(0)
-            df[col] = df[col].replace([float('inf'), float('-inf')], 0)
-            df[col] = df[col].astype(int)
+            values = np.nan_to_num(df[col].to_numpy(dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+            df[col] = pd.to_numeric(values.astype(np.int64), downcast=downcast)
     
     return df
 
+def top_n(df, column, n=5):
+    """Return the `n` rows with the largest `column` values, like `df.nlargest(n, column)`.
+    
+    Selects the candidates with `np.partition` (linear time) instead of sorting
+    the whole column; only the candidates are sorted.
+    """
+    # float64 so negating works for the unsigned star columns too
+    values = df[column].to_numpy(dtype=np.float64)
+    
+    if len(values) > n:
+        threshold = np.partition(values, len(values) - n)[len(values) - n]
+        candidates = np.flatnonzero(values >= threshold)
+    else:
+        candidates = np.arange(len(values))
+    
+    # Stable sort keeps ties in frame order, like nlargest(keep='first')
+    order = candidates[np.argsort(-values[candidates], kind='stable')][:n]
+    return df.iloc[order]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_category_breakdown(_filtered_df, latest_date, total_count, filter_key):
+    """Count repositories and sum their star growth per category (cached per filter).
+    
+    `_filtered_df` is the base frame of (`latest_date`, `total_count`) selected
+    with the filter values in `filter_key`; the cache is also cleared whenever
+    the base frame is rebuilt. The result is indexed by category name.
+    """
+    # One grouping pass for the counts and the star flow (total star growth);
+    # observed=True skips categories without rows. Largest categories first.
+    category_stats = _filtered_df.groupby('category', observed=True).agg(
+        Count=('star_growth', 'size'),
+        Star_Flow=('star_growth', 'sum')
+    ).sort_values('Count', ascending=False, kind='stable')
+    category_stats.insert(1, 'Percentage', (category_stats['Count'] / len(_filtered_df) * 100).round(1))
+    category_stats = category_stats.rename(columns={'Star_Flow': 'Star Flow'})
+    
+    # Add percentage of star flow
+    total_star_flow = category_stats['Star Flow'].sum()
+    category_stats['% of Star Flow'] = (category_stats['Star Flow'] / total_star_flow * 100).round(1)
+    
+    return category_stats
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_top_performers(_filtered_df, latest_date, total_count, filter_key, categories=None):
+    """Select the top 5 repositories by growth % and by star growth (cached per filter).
+    
+    Keyed like `get_category_breakdown`; `categories` is a tuple of category
+    names, or None for all categories.
+    Returns a `(top_growth, top_stars)` tuple, or None if no repository matches.
+    """
+    if categories is not None:
+        category = _filtered_df['category']
+        selected_codes = category.cat.categories.get_indexer(categories)
+        _filtered_df = _filtered_df[np.isin(category.cat.codes.to_numpy(), selected_codes)]
+    
+    if _filtered_df.empty:
+        return None
+    
+    top_growth = top_n(_filtered_df, 'growth_percent')[['full_name', 'category', 'description', 'growth_percent', 'star_growth']]
+    top_stars = top_n(_filtered_df, 'star_growth')[['full_name', 'category', 'description', 'star_growth', 'growth_percent']]
+    return top_growth, top_stars
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _expected_password():
+    """Get password from secrets or environment variable (re-read every minute, so a rotated password applies)."""
+    return st.secrets.get("password") or os.getenv("STREAMLIT_PASSWORD")
+
 def check_password():
     """Returns `True` if the user had the correct password."""
-    # Get password from secrets or environment variable
-    expected_password = st.secrets.get("password") or os.getenv("STREAMLIT_PASSWORD")
+    # Already authenticated in this session, skip the secrets lookup and widgets
+    if st.session_state.get("password_correct"):
+        return True
+    
+    expected_password = _expected_password()
     
     if not expected_password:
+        # Don't keep the unset value cached, a password configured later applies on the next run
+        _expected_password.clear()
         st.error("Password not configured. Please set STREAMLIT_PASSWORD environment variable or add to .streamlit/secrets.toml")
         st.stop()
     
     def password_entered():
-        if st.session_state["password"] == expected_password:
+        # Constant-time comparison, bytes so non-ASCII passwords work too
+        if hmac.compare_digest(st.session_state["password"].encode(), expected_password.encode()):
             st.session_state["password_correct"] = True
             del st.session_state["password"]  # Don't store password
         else:
@@ -163,27 +415,30 @@ def main():
         st.stop()
     
     st.title("📊 GitHub Trends Analysis Dashboard")
+    
+    # MongoDB results are cached for 5 minutes; allow picking up a new analysis sooner
+    if st.button("🔄 Refresh data", help="Reload the latest analysis from MongoDB"):
+        _fetch_latest_doc.clear()
+        load_formatted_df.clear()
+        get_category_breakdown.clear()
+        get_top_performers.clear()
+    
     st.markdown("---")
     
     # Load data
     with st.spinner("Loading latest analysis from MongoDB..."):
-        analysis_data = get_latest_analysis()
+        latest_analysis = get_latest_analysis()
     
-    if analysis_data is None:
+    if latest_analysis is None:
         st.stop()
     
-    # Convert to DataFrame
-    df = convert_analysis_to_dataframe(analysis_data)
+    latest_doc, total_count, df = latest_analysis
     if df is None:
         st.error("No analysis results found.")
         st.stop()
     
-    if df.empty:
-        st.error("Analysis results are empty.")
-        st.stop()
-    
-    # Format metrics
-    df = format_metrics(df)
+    # Parse the analysis metadata once for the header metrics
+    meta = parse_meta(latest_doc)
     
     # Display analysis metadata
     col1, col2, col3, col4 = st.columns(4)
@@ -191,197 +446,189 @@ def main():
     with col1:
         st.metric(
             "Total Repositories", 
-            f"{len(df):,}"
+            f"{total_count:,}"
         )
     
     with col2:
-        # Get analysis date from the first document
-        if analysis_data and len(analysis_data) > 0:
-            analysis_date = analysis_data[0].get('analysis_date')
-            if analysis_date:
-                if isinstance(analysis_date, str):
-                    analysis_date = datetime.fromisoformat(analysis_date.replace('Z', '+00:00'))
-                st.metric(
-                    "Analysis Date", 
-                    analysis_date.strftime("%Y-%m-%d %H:%M")
-                )
+        if meta.analysis_date:
+            st.metric(
+                "Analysis Date", 
+                meta.analysis_date.strftime("%Y-%m-%d %H:%M")
+            )
     
     with col3:
-        # Get start and end dates from the first document
-        if analysis_data and len(analysis_data) > 0:
-            start_date = analysis_data[0].get('analysis_start_date')
-            end_date = analysis_data[0].get('analysis_end_date')
-            if start_date and end_date:
-                if isinstance(start_date, str):
-                    start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                if isinstance(end_date, str):
-                    end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                st.metric(
-                    "Analysis Period", 
-                    f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-                )
-    
-    with col4:
-        # Get period days from the first document
-        if analysis_data and len(analysis_data) > 0:
-            period_days = analysis_data[0].get('analysis_period_days', 0)
+        if meta.start_date and meta.end_date:
             st.metric(
-                "Period (Days)", 
-                period_days
+                "Analysis Period", 
+                f"{meta.start_date.strftime('%Y-%m-%d')} to {meta.end_date.strftime('%Y-%m-%d')}"
             )
     
+    with col4:
+        st.metric(
+            "Period (Days)", 
+            meta.period_days
+        )
+    
     st.markdown("---")
     
-    # Filters
+    # Filters - submitted together, so editing them does not rerun the page
     st.subheader("🔍 Filters")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        # Filter by category
-        if 'category' in df.columns:
-            categories = sorted(df['category'].dropna().unique())
-            # Capitalize first letter of each category
-            categories_capitalized = [cat.capitalize() if cat else cat for cat in categories]
-            selected_categories = st.multiselect(
-                "Categories",
-                options=categories_capitalized,
-                default=categories_capitalized,
-                help="Select categories to filter by"
+    with st.form("filters"):
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            # Filter by category
+            if 'category' in df.columns:
+                # Categorical categories are sorted; capitalize the labels once
+                # and reuse them for every category widget and table below
+                categories = df['category'].cat.categories
+                category_labels = dict(zip(categories, categories.map(str.capitalize)))
+                label_categories = {label: cat for cat, label in category_labels.items()}
+                selected_categories = st.multiselect(
+                    "Categories",
+                    options=list(category_labels.values()),
+                    default=list(category_labels.values()),
+                    help="Select categories to filter by"
+                )
+                # Convert back to the original category names for filtering
+                selected_categories = [label_categories[label] for label in selected_categories]
+            else:
+                selected_categories = []
+        
+        with col2:
+            # Filter by minimum growth percentage
+            min_growth = st.number_input(
+                "Minimum Growth %", 
+                min_value=0.0, 
+                max_value=1000.0, 
+                value=0.0, 
+                step=0.1,
+                key="filter_min_growth"
             )
-            # Convert back to original case for filtering
-            selected_categories = [cat.lower() if cat else cat for cat in selected_categories]
-        else:
-            selected_categories = []
-    
-    with col2:
-        # Filter by minimum growth percentage
-        min_growth = st.number_input(
-            "Minimum Growth %", 
-            min_value=0.0, 
-            max_value=1000.0, 
-            value=0.0, 
-            step=0.1
-        )
-    
-    with col3:
-        # Filter by minimum star growth
-        min_star_growth = st.number_input(
-            "Minimum Star Growth", 
-            min_value=0, 
-            max_value=10000, 
-            value=0, 
-            step=1
-        )
-    
-    with col4:
-        # Filter by minimum end stars
-        min_end_stars = st.number_input(
-            "Minimum End Stars", 
-            min_value=0, 
-            max_value=100000, 
-            value=0, 
-            step=100
-        )
-    
-    # Apply filters
-    filtered_df = df.copy()
+        
+        with col3:
+            # Filter by minimum star growth
+            min_star_growth = st.number_input(
+                "Minimum Star Growth", 
+                min_value=0, 
+                max_value=10000, 
+                value=0, 
+                step=1,
+                key="filter_min_star_growth"
+            )
+        
+        with col4:
+            # Filter by minimum end stars
+            min_end_stars = st.number_input(
+                "Minimum End Stars", 
+                min_value=0, 
+                max_value=100000, 
+                value=0, 
+                step=100,
+                key="filter_min_end_stars"
+            )
+        
+        st.form_submit_button("Apply")
     
     # Filter by category
+    category_filter = None
     if selected_categories and len(selected_categories) < len(categories):
-        filtered_df = filtered_df[filtered_df['category'].isin(selected_categories)]
-    
-    if min_growth > 0:
-        filtered_df = filtered_df[filtered_df['growth_percent'] >= min_growth]
+        category_filter = tuple(selected_categories)
     
-    if min_star_growth > 0:
-        filtered_df = filtered_df[filtered_df['star_growth'] >= min_star_growth]
+    if min_growth > 0 and category_filter is None and min_star_growth == 0 and min_end_stars == 0:
+        # df is sorted by growth_percent (descending), the matches are a prefix
+        growth = df['growth_percent'].to_numpy()
+        threshold = growth.dtype.type(min_growth)
+        filtered_df = df.iloc[:len(growth) - growth[::-1].searchsorted(threshold, side='left')]
+    else:
+        # Apply filters as a single boolean mask over the cached DataFrame
+        mask = np.ones(len(df), dtype=bool)
+        
+        if category_filter:
+            # Compare integer category codes instead of strings
+            selected_codes = categories.get_indexer(category_filter)
+            mask &= np.isin(df['category'].cat.codes.to_numpy(), selected_codes)
+        
+        if min_growth > 0:
+            mask &= df['growth_percent'].to_numpy() >= min_growth
+        
+        if min_star_growth > 0:
+            mask &= df['star_growth'].to_numpy() >= min_star_growth
+        
+        if min_end_stars > 0:
+            mask &= df['end_stars'].to_numpy() >= min_end_stars
+        
+        filtered_df = df if mask.all() else df.loc[mask]
     
-    if min_end_stars > 0:
-        filtered_df = filtered_df[filtered_df['end_stars'] >= min_end_stars]
+    # Key for the cached views of filtered_df below
+    filter_key = (min_growth, min_star_growth, min_end_stars, category_filter)
     
     # Display filtered results count
-    st.info(f"Showing {len(filtered_df)} of {len(df)} repositories")
+    st.info(f"Showing {len(filtered_df)} of {total_count} repositories")
     
     # Interactive table
     st.subheader("📋 Repository Analysis Results")
     
-    # Select columns to display
+    # Columns to display, in order. The cached frame is handed to the table
+    # as is; the column labels come from column_config.
     display_columns = [
         'full_name', 'author', 'description', 'category', 'start_stars', 
         'end_stars', 'star_growth', 'growth_per_day', 'growth_percent', 'url'
     ]
     
-    # Filter DataFrame to only show selected columns
-    display_df = filtered_df[display_columns].copy()
-    
-    # Rename columns for better display
-    column_mapping = {
-        'full_name': 'Repository',
-        'author': 'Author',
-        'description': 'Description',
-        'category': 'Category',
-        'start_stars': 'Start Stars',
-        'end_stars': 'End Stars',
-        'star_growth': 'Star Growth',
-        'growth_per_day': 'Growth/Day',
-        'growth_percent': 'Growth %',
-        'url': 'URL'
-    }
-    
-    display_df = display_df.rename(columns=column_mapping)
-    
     # Display the table with sorting
     st.dataframe(
-        display_df,
+        filtered_df,
         use_container_width=True,
         hide_index=True,
+        column_order=display_columns,
         column_config={
-            "Repository": st.column_config.TextColumn(
+            "full_name": st.column_config.TextColumn(
                 "Repository",
                 width="medium",
                 help="Repository name (owner/repo)"
             ),
-            "Author": st.column_config.TextColumn(
+            "author": st.column_config.TextColumn(
                 "Author",
                 width="small"
             ),
-            "Description": st.column_config.TextColumn(
+            "description": st.column_config.TextColumn(
                 "Description",
                 width="large",
                 help="Repository description"
             ),
-            "Category": st.column_config.TextColumn(
+            "category": st.column_config.TextColumn(
                 "Category",
                 width="small",
                 help="Repository category"
             ),
-            "Start Stars": st.column_config.NumberColumn(
+            "start_stars": st.column_config.NumberColumn(
                 "Start Stars",
                 format="%d",
                 width="small"
             ),
-            "End Stars": st.column_config.NumberColumn(
+            "end_stars": st.column_config.NumberColumn(
                 "End Stars",
                 format="%d",
                 width="small"
             ),
-            "Star Growth": st.column_config.NumberColumn(
+            "star_growth": st.column_config.NumberColumn(
                 "Star Growth",
                 format="%d",
                 width="small"
             ),
-            "Growth/Day": st.column_config.NumberColumn(
+            "growth_per_day": st.column_config.NumberColumn(
                 "Growth/Day",
                 format="%.2f",
                 width="small"
             ),
-            "Growth %": st.column_config.NumberColumn(
+            "growth_percent": st.column_config.NumberColumn(
                 "Growth %",
                 format="%.2f%%",
                 width="small"
             ),
-            "URL": st.column_config.LinkColumn(
+            "url": st.column_config.LinkColumn(
                 "URL",
                 width="medium"
             )
@@ -393,45 +640,32 @@ def main():
     st.subheader("📈 Summary Statistics")
     
     if filtered_df is not None and not filtered_df.empty:
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            avg_growth = filtered_df['growth_percent'].mean()
-            st.metric("Average Growth %", f"{avg_growth:.2f}%")
-        
-        with col2:
-            max_growth = filtered_df['growth_percent'].max()
-            st.metric("Max Growth %", f"{max_growth:.2f}%")
+        summary = get_summary_stats(filtered_df)
         
-        with col3:
-            total_star_growth = filtered_df['star_growth'].sum()
-            st.metric("Total Star Growth", f"{total_star_growth:,}")
-        
-        with col4:
-            avg_stars = filtered_df['end_stars'].mean()
-            st.metric("Average End Stars", f"{avg_stars:.0f}")
+        if summary is not None:
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Average Growth %", f"{summary['avg_growth']:.2f}%")
+            
+            with col2:
+                st.metric("Max Growth %", f"{summary['max_growth']:.2f}%")
+            
+            with col3:
+                st.metric("Total Star Growth", f"{int(summary['total_star_growth']):,}")
+            
+            with col4:
+                st.metric("Average End Stars", f"{summary['avg_stars']:.0f}")
         
         # Category breakdown
         if 'category' in filtered_df.columns:
             st.markdown("---")
             st.subheader("📊 Category Breakdown")
             
-            category_counts = filtered_df['category'].value_counts()
-            category_stats = pd.DataFrame({
-                'Category': [cat.capitalize() if cat else cat for cat in category_counts.index],
-                'Count': category_counts.values,
-                'Percentage': (category_counts.values / len(filtered_df) * 100).round(1)
-            })
-            
-            # Add star flow (total star growth) for each category
-            category_star_flow = filtered_df.groupby('category')['star_growth'].sum()
-            # Create mapping with capitalized categories
-            category_star_flow_capitalized = {cat.capitalize() if cat else cat: value for cat, value in category_star_flow.items()}
-            category_stats['Star Flow'] = category_stats['Category'].map(category_star_flow_capitalized)
-            
-            # Add percentage of star flow
-            total_star_flow = category_stats['Star Flow'].sum()
-            category_stats['% of Star Flow'] = (category_stats['Star Flow'] / total_star_flow * 100).round(1)
+            category_stats = get_category_breakdown(
+                filtered_df, latest_doc.get('analysis_date'), total_count, filter_key
+            )
+            category_stats.insert(0, 'Category', category_stats.index.map(category_labels))
             
             st.write("**Repositories by Category**")
             st.dataframe(category_stats, hide_index=True)
@@ -443,70 +677,56 @@ def main():
     if filtered_df is not None and not filtered_df.empty:
         # Category filter for top performers
         if 'category' in filtered_df.columns:
+            present_categories = set(filtered_df['category'].dropna().unique())
+            top_performer_labels = [label for cat, label in category_labels.items() if cat in present_categories]
             top_performer_categories = st.multiselect(
                 "Categories for Top Performers Analysis",
-                options=[cat.capitalize() if cat else cat for cat in sorted(filtered_df['category'].dropna().unique())],
-                default=[cat.capitalize() if cat else cat for cat in sorted(filtered_df['category'].dropna().unique())],
+                options=top_performer_labels,
+                default=top_performer_labels,
                 help="Select categories to include in top performers analysis"
             )
-            # Convert back to original case for filtering
-            top_performer_categories = [cat.lower() if cat else cat for cat in top_performer_categories]
-            
-            # Filter data for top performers
-            top_performers_df = filtered_df[filtered_df['category'].isin(top_performer_categories)]
+            # Convert back to the original category names for filtering
+            top_performer_categories = tuple(label_categories[label] for label in top_performer_categories)
         else:
-            top_performers_df = filtered_df
+            top_performer_categories = None
+        
+        top_performers = get_top_performers(
+            filtered_df, latest_doc.get('analysis_date'), total_count, filter_key, top_performer_categories
+        )
         
-        if not top_performers_df.empty:
+        if top_performers is not None:
+            top_growth, top_stars = top_performers
             col1, col2 = st.columns(2)
             
             with col1:
                 st.write("**Top 5 by Growth %**")
-                top_growth = top_performers_df.nlargest(5, 'growth_percent')[['full_name', 'category', 'description', 'growth_percent', 'star_growth']]
                 # Capitalize category names for display
-                top_growth['category'] = top_growth['category'].apply(lambda x: x.capitalize() if x else x)
-                # Rename columns for better display
-                top_growth = top_growth.rename(columns={
-                    'full_name': 'Repository',
-                    'category': 'Category',
-                    'description': 'Description',
-                    'growth_percent': 'Growth %',
-                    'star_growth': 'Star Growth'
-                })
+                top_growth['category'] = top_growth['category'].map(category_labels)
                 st.dataframe(
                     top_growth, 
                     hide_index=True,
                     column_config={
-                        "Repository": st.column_config.TextColumn("Repository", width="medium"),
-                        "Category": st.column_config.TextColumn("Category", width="small"),
-                        "Description": st.column_config.TextColumn("Description", width="large"),
-                        "Growth %": st.column_config.NumberColumn("Growth %", format="%.2f%%", width="small"),
-                        "Star Growth": st.column_config.NumberColumn("Star Growth", format="%d", width="small")
+                        "full_name": st.column_config.TextColumn("Repository", width="medium"),
+                        "category": st.column_config.TextColumn("Category", width="small"),
+                        "description": st.column_config.TextColumn("Description", width="large"),
+                        "growth_percent": st.column_config.NumberColumn("Growth %", format="%.2f%%", width="small"),
+                        "star_growth": st.column_config.NumberColumn("Star Growth", format="%d", width="small")
                     }
                 )
             
             with col2:
                 st.write("**Top 5 by Star Growth**")
-                top_stars = top_performers_df.nlargest(5, 'star_growth')[['full_name', 'category', 'description', 'star_growth', 'growth_percent']]
                 # Capitalize category names for display
-                top_stars['category'] = top_stars['category'].apply(lambda x: x.capitalize() if x else x)
-                # Rename columns for better display
-                top_stars = top_stars.rename(columns={
-                    'full_name': 'Repository',
-                    'category': 'Category',
-                    'description': 'Description',
-                    'star_growth': 'Star Growth',
-                    'growth_percent': 'Growth %'
-                })
+                top_stars['category'] = top_stars['category'].map(category_labels)
                 st.dataframe(
                     top_stars, 
                     hide_index=True,
                     column_config={
-                        "Repository": st.column_config.TextColumn("Repository", width="medium"),
-                        "Category": st.column_config.TextColumn("Category", width="small"),
-                        "Description": st.column_config.TextColumn("Description", width="large"),
-                        "Star Growth": st.column_config.NumberColumn("Star Growth", format="%d", width="small"),
-                        "Growth %": st.column_config.NumberColumn("Growth %", format="%.2f%%", width="small")
+                        "full_name": st.column_config.TextColumn("Repository", width="medium"),
+                        "category": st.column_config.TextColumn("Category", width="small"),
+                        "description": st.column_config.TextColumn("Description", width="large"),
+                        "star_growth": st.column_config.NumberColumn("Star Growth", format="%d", width="small"),
+                        "growth_percent": st.column_config.NumberColumn("Growth %", format="%.2f%%", width="small")
                     }
                 )
         else: